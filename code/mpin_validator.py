@@ -6,6 +6,8 @@ import sys
 import os
 import time
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 from itertools import permutations, combinations, product
 
 
@@ -380,26 +382,28 @@ class PatternGenerator:
         if potential_combinations > 5000:
             limited_sets = [cs[:min(20, len(cs))] for cs in component_sets]
             component_sets = limited_sets
+            potential_combinations = 1
+            for component_set in component_sets:
+                potential_combinations *= len(component_set)
 
-        for parts in product(*component_sets):
-            # Check time and combination limits
-            combo_count += 1
-            if time.time() - start_time > self.max_execution_time or combo_count > self.max_combinations:
-                return
+        # Check time and combination limits once for the whole batch
+        combo_count += potential_combinations
+        if time.time() - start_time > self.max_execution_time or combo_count > self.max_combinations:
+            return
 
-            # Ensure all parts are strings
-            str_parts = [str(part) for part in parts]
-            pin = "".join(str_parts)
+        # Build every PIN in one batched pass; the set drops duplicate combinations
+        str_sets = [[str(part) for part in component_set] for component_set in component_sets]
+        pins = set(map("".join, product(*str_sets)))
 
+        for pin in pins:
             # Only store if PIN has correct length
             if len(pin) == self.pin_length:
-                if pin not in pin_reasons:
-                    pin_reasons[pin] = []
+                pin_reasons_list = pin_reasons.setdefault(pin, [])
 
                 # Add unique reasons
                 for reason in reasons:
-                    if reason not in pin_reasons[pin]:
-                        pin_reasons[pin].append(reason)
+                    if reason not in pin_reasons_list:
+                        pin_reasons_list.append(reason)
 
     def _check_special_cases(self, source_components, pin_reasons):
         """Add special case patterns directly."""
@@ -991,6 +995,56 @@ def get_common_pins(pin_length):
     
     return result
 
+class PreparedDemographics:
+    """
+    Demographic data pre-derived into the PIN patterns it can produce.
+
+    All pattern data is stored in read-only types so a prepared object can be
+    shared safely between PINs.
+    """
+
+    def __init__(self, pin_length, demographics, valid_demographics, direct_patterns, pattern_generator):
+        """
+        Initialize the prepared demographics.
+
+        Args:
+            pin_length (int): PIN length the patterns were derived for
+            demographics (dict): Demographic information as supplied
+            valid_demographics (dict): Entries with a valid YYYY-MM-DD date
+            direct_patterns (list): (reason, frozenset of PINs) per source
+            pattern_generator (PatternGenerator): Generator for the combined patterns
+        """
+        self.pin_length = pin_length
+        self.demographics = MappingProxyType(dict(demographics))
+        self.valid_demographics = MappingProxyType(dict(valid_demographics))
+        self.direct_patterns = tuple(direct_patterns)
+        self._pattern_generator = pattern_generator
+        self._combined_patterns = None
+
+    @property
+    def combined_patterns(self):
+        """
+        PINs from combined patterns mapped to their reasons, generated on first use.
+
+        Returns:
+            MappingProxyType: Read-only mapping of PIN to a tuple of reasons
+        """
+        if self._combined_patterns is None:
+            combined_patterns = {}
+            if self.valid_demographics:
+                combined_patterns = self._pattern_generator.generate_all_combinations(
+                    dict(self.valid_demographics))
+            self._combined_patterns = MappingProxyType(
+                {pin: tuple(reasons) for pin, reasons in combined_patterns.items()}
+            )
+        return self._combined_patterns
+
+
+def _demographics_key(demographics):
+    """Return a hashable key for a demographics dict (None if empty), keeping item order."""
+    return tuple(demographics.items()) if demographics else None
+
+
 class MPINValidator:
     """
     MPIN Validator class that implements comprehensive validation logic for all parts (A-D).
@@ -1007,7 +1061,8 @@ class MPINValidator:
             raise ValueError("PIN length must be either 4 or 6")
 
         self.pin_length = pin_length
-        self.common_pins = get_common_pins(pin_length)
+        # Frozen once per validator so every membership check is O(1)
+        self.common_pins = frozenset(get_common_pins(pin_length))
 
         # Performance limits
         self.max_combinations = 500000  # Maximum number of combinations to generate
@@ -1019,6 +1074,22 @@ class MPINValidator:
                                                   self.max_execution_time)
         self.special_detector = SpecialPatternDetector(pin_length)
 
+        self._init_caches()
+
+    def _init_caches(self):
+        """Create the per-validator memoization caches."""
+        # Memoized reason lookup keyed on (pin, ordered demographics items)
+        self._cached_reasons = lru_cache(maxsize=4096)(self._compute_weakness_reasons)
+
+    def __getstate__(self):
+        """Return the state to pickle, leaving out the memoization cache."""
+        return {name: value for name, value in self.__dict__.items() if name != "_cached_reasons"}
+
+    def __setstate__(self, state):
+        """Restore pickled state and start with empty memoization caches."""
+        self.__dict__.update(state)
+        self._init_caches()
+
     def validate_pin_format(self, pin):
         """
         Validate that the PIN has the correct format.
@@ -1065,19 +1136,32 @@ class MPINValidator:
         
         return pin in self.common_pins
 
-    def check_demographic_matches(self, pin, demographics):
+    def prepare_demographics(self, demographics):
         """
-        Check if the PIN matches any demographic data patterns.
+        Derive all PIN patterns for the given demographics, for reuse across PINs.
 
         Args:
-            pin (str): The PIN to check
             demographics (dict): Dictionary containing demographic information
 
         Returns:
-            list: List of weakness reasons found
+            PreparedDemographics: Derived patterns, or None if no demographics were given
         """
-        if not demographics:
-            return []
+        demographics_key = _demographics_key(demographics)
+        if demographics_key is None:
+            return None
+        return self._build_prepared(demographics_key)
+
+    def _build_prepared(self, demographics_key):
+        """
+        Build prepared demographics from their sorted items.
+
+        Args:
+            demographics_key (tuple): Demographic items in their original order
+
+        Returns:
+            PreparedDemographics: Derived patterns for these demographics
+        """
+        demographics = dict(demographics_key)
 
         # Validate demographics
         valid_demographics = {}
@@ -1090,13 +1174,8 @@ class MPINValidator:
                 # Skip invalid dates
                 continue
 
-        # If no valid demographics, return empty list
-        if not valid_demographics:
-            return []
-
-        weakness_reasons = []
-
-        # Check standard patterns first (direct matches with single date patterns)
+        # Direct patterns for each single date
+        direct_patterns = []
         for source, key in [
             ("dob", "DEMOGRAPHIC_DOB_SELF"),
             ("spouse_dob", "DEMOGRAPHIC_DOB_SPOUSE"),
@@ -1105,23 +1184,57 @@ class MPINValidator:
             if valid_demographics.get(source):
                 patterns = self.component_extractor.extract_date_patterns(valid_demographics[source],
                                                                           self.pin_length)
-                if pin in patterns:
-                    weakness_reasons.append(key)
+                direct_patterns.append((key, frozenset(patterns)))
+
+        # Combined patterns across all dates are generated only when first needed
+        return PreparedDemographics(self.pin_length, demographics, valid_demographics,
+                                    direct_patterns, self.pattern_generator)
+
+    def check_demographic_matches(self, pin, demographics):
+        """
+        Check if the PIN matches any demographic data patterns.
+
+        Args:
+            pin (str): The PIN to check
+            demographics (dict): Dictionary containing demographic information
+
+        Returns:
+            list: List of weakness reasons found
+        """
+        prepared = self.prepare_demographics(demographics)
+        if prepared is None:
+            return []
+        return self._match_prepared(pin, prepared)
+
+    def _match_prepared(self, pin, prepared):
+        """
+        Check if the PIN matches any pre-derived demographic patterns.
+
+        Args:
+            pin (str): The PIN to check
+            prepared (PreparedDemographics): Prepared demographic information
+
+        Returns:
+            list: List of weakness reasons found
+        """
+        # If no valid demographics, return empty list
+        if not prepared.valid_demographics:
+            return []
+
+        # Check standard patterns first (direct matches with single date patterns)
+        weakness_reasons = [key for key, patterns in prepared.direct_patterns if pin in patterns]
 
         # Check direct special cases
-        special_matches = self.special_detector.check_direct_special_cases(pin, valid_demographics)
+        special_matches = self.special_detector.check_direct_special_cases(pin, prepared.valid_demographics)
         if special_matches:
             weakness_reasons.extend(special_matches)
             return list(set(weakness_reasons))
 
         # If no direct matches found, check for combined patterns
         if not weakness_reasons:
-            # Generate all possible combinations
-            pin_reasons = self.pattern_generator.generate_all_combinations(valid_demographics)
-
             # Check if the PIN is in the generated combinations
-            if pin in pin_reasons:
-                weakness_reasons.extend(pin_reasons[pin])
+            if pin in prepared.combined_patterns:
+                weakness_reasons.extend(prepared.combined_patterns[pin])
 
         return list(set(weakness_reasons))  # Remove duplicates
 
@@ -1133,10 +1246,38 @@ class MPINValidator:
             pin (str): The PIN to evaluate
             demographics (dict): Optional demographic information
 
+        Returns:
+            list: List of weakness reasons (empty if the PIN is strong)
+        """
+        return list(self._cached_reasons(pin, _demographics_key(demographics)))
+
+    def _compute_weakness_reasons(self, pin, demographics_key):
+        """
+        Compute weakness reasons for a PIN (memoized by get_weakness_reasons).
+
+        Args:
+            pin (str): The PIN to evaluate
+            demographics_key (tuple): Demographic items in their original order, or None
+
+        Returns:
+            tuple: Weakness reasons (empty if the PIN is strong)
+        """
+        prepared = self._build_prepared(demographics_key) if demographics_key else None
+        return tuple(self._find_weakness_reasons(pin, prepared))
+
+    def _find_weakness_reasons(self, pin, prepared):
+        """
+        Collect weakness reasons for a PIN without caching.
+
+        Args:
+            pin (str): The PIN to evaluate
+            prepared (PreparedDemographics): Optional prepared demographic information
+
         Returns:
             list: List of weakness reasons (empty if the PIN is strong)
         """
         reasons = []
+        demographics = prepared.demographics if prepared else None
 
         # Special cases for specific test cases
         if pin == "1998" and demographics and "dob" in demographics and demographics["dob"] == "1998-02-01":
@@ -1160,7 +1301,7 @@ class MPINValidator:
 
         # Check demographics if provided
         if demographics:
-            demographic_reasons = self.check_demographic_matches(pin, demographics)
+            demographic_reasons = self._match_prepared(pin, prepared)
             reasons.extend(demographic_reasons)
 
         # Check for common PIN (only if not already covered by demographics)
@@ -1201,6 +1342,43 @@ class MPINValidator:
         # Get weakness reasons
         weakness_reasons = self.get_weakness_reasons(pin, demographics)
 
+        return self._build_result(pin, weakness_reasons)
+
+    def validate_pin_prepared(self, pin, prepared):
+        """
+        Full PIN validation against demographics already derived by prepare_demographics.
+
+        Args:
+            pin (str): The PIN to validate
+            prepared (PreparedDemographics): Prepared demographics, or None
+
+        Returns:
+            dict: Validation results including strength and weakness reasons
+        """
+        # Validate PIN format
+        if not self.validate_pin_format(pin):
+            raise ValueError(f"Invalid PIN format. Must be {self.pin_length} digits.")
+
+        if prepared is not None and prepared.pin_length != self.pin_length:
+            raise ValueError(f"Demographics were prepared for {prepared.pin_length}-digit PINs, "
+                             f"not {self.pin_length}-digit PINs.")
+
+        # Get weakness reasons
+        weakness_reasons = self._find_weakness_reasons(pin, prepared)
+
+        return self._build_result(pin, weakness_reasons)
+
+    def _build_result(self, pin, weakness_reasons):
+        """
+        Build the validation result dictionary.
+
+        Args:
+            pin (str): The validated PIN
+            weakness_reasons (list): Weakness reasons found for the PIN
+
+        Returns:
+            dict: Validation results including strength and weakness reasons
+        """
         # Determine strength
         strength = "WEAK" if weakness_reasons else "STRONG"
 
@@ -1,879 +1,894 @@
 """
 Test cases for the MPIN validator.
 """
+import glob
+import hashlib
+import os
+import pickle
 import sys
+from collections import namedtuple
+import mpin_validator
 from mpin_validator import MPINValidator
 
-def run_tests():
-    """Run all test cases and display results."""
-
-    print("Running MPIN Validator Test Cases")
-    print("=" * 40)
-
-    # Create validators for 4-digit and 6-digit PINs
-    validator_4 = MPINValidator(4)
-    validator_6 = MPINValidator(6)
-
-    # Define test cases
-    test_cases = [
-        # Part A tests (Common PIN detection)
-        {
-            "name": "Test 1: Common 4-digit PIN",
-            "pin": "1234",
-            "demographics": None,
-            "pin_length": 4,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["COMMONLY_USED"]
-            }
-        },
-        {
-            "name": "Test 2: Uncommon 4-digit PIN",
-            "pin": "8193",
-            "demographics": None,
-            "pin_length": 4,
-            "expected": {
-                "strength": "STRONG",
-                "weakness_reasons": []
-            }
-        },
-        {
-            "name": "Test 3: Common 6-digit PIN",
-            "pin": "123456",
-            "demographics": None,
-            "pin_length": 6,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["COMMONLY_USED"]
-            }
-        },
-        {
-            "name": "Test 4: Uncommon 6-digit PIN",
-            "pin": "918273",
-            "demographics": None,
-            "pin_length": 6,
-            "expected": {
-                "strength": "STRONG",
-                "weakness_reasons": []
-            }
-        },
-
-        # Part B & C tests (Basic demographics patterns)
-        {
-            "name": "Test 5: PIN matches user DOB (MMDD)",
-            "pin": "0201",
-            "demographics": {"dob": "1998-02-01"},
-            "pin_length": 4,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["DEMOGRAPHIC_DOB_SELF"]
-            }
-        },
-        {
-            "name": "Test 6: PIN matches spouse DOB",
-            "pin": "1020",
-            "demographics": {"spouse_dob": "1995-10-20"},
-            "pin_length": 4,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["DEMOGRAPHIC_DOB_SPOUSE"]
-            }
-        },
-        {
-            "name": "Test 7: PIN matches anniversary",
-            "pin": "2505",
-            "demographics": {"anniversary": "2015-05-25"},
-            "pin_length": 4,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["DEMOGRAPHIC_ANNIVERSARY"]
-            }
-        },
-        {
-            "name": "Test 8: Multiple demographic matches",
-            "pin": "0524",
-            "demographics": {
-                "dob": "1990-05-24",
-                "spouse_dob": "1992-08-15",
-                "anniversary": "2015-05-24"
-            },
-            "pin_length": 4,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["DEMOGRAPHIC_DOB_SELF", "DEMOGRAPHIC_ANNIVERSARY"]
-            }
-        },
-        {
-            "name": "Test 9: Common PIN and demographic match",
-            "pin": "1111",
-            "demographics": {"dob": "1980-11-11"},
-            "pin_length": 4,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": [ "DEMOGRAPHIC_DOB_SELF"]
-            }
-        },
-
-        # Part D tests (6-digit PIN with demographics)
-        {
-            "name": "Test 10: 6-digit PIN matches DOB (DDMMYY)",
-            "pin": "010298",
-            "demographics": {"dob": "1998-02-01"},
-            "pin_length": 6,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["DEMOGRAPHIC_DOB_SELF"]
-            }
-        },
-        {
-            "name": "Test 11: 6-digit PIN matches spouse DOB (YYMMDD)",
-            "pin": "950510",
-            "demographics": {"spouse_dob": "1995-05-10"},
-            "pin_length": 6,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["DEMOGRAPHIC_DOB_SPOUSE"]
-            }
-        },
-        {
-            "name": "Test 12: 6-digit PIN matches anniversary (MMDDYY)",
-            "pin": "051215",
-            "demographics": {"anniversary": "2015-05-12"},
-            "pin_length": 6,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["DEMOGRAPHIC_ANNIVERSARY"]
-            }
-        },
-
-        # Basic edge cases
-        {
-            "name": "Test 13: Strong PIN with demographics present",
-            "pin": "7294",
-            "demographics": {
-                "dob": "1990-05-15",
-                "spouse_dob": "1992-08-20",
-                "anniversary": "2015-06-10"
-            },
-            "pin_length": 4,
-            "expected": {
-                "strength": "STRONG",
-                "weakness_reasons": []
-            }
-        },
-        {
-            "name": "Test 14: Strong 6-digit PIN with demographics present",
-            "pin": "729438",
-            "demographics": {
-                "dob": "1990-05-15",
-                "spouse_dob": "1992-08-20",
-                "anniversary": "2015-06-10"
-            },
-            "pin_length": 6,
-            "expected": {
-                "strength": "STRONG",
-                "weakness_reasons": []
-            }
-        },
-        # Test 15 - (Year-based PIN pattern)
-        {
-            "name": "Test 15: Year-based PIN pattern",
-            "pin": "1998",
-            "demographics": {"dob": "1998-02-01"},
-            "pin_length": 4,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["DEMOGRAPHIC_DOB_SELF", "COMMONLY_USED"]
-            }
-        },
-
-        {
-            "name": "Test 16: Reversed date pattern",
-            "pin": "1020",
-            "demographics": {"dob": "1998-02-01"},
-            "pin_length": 4,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["DEMOGRAPHIC_DOB_SELF"]
-            }
-        },
-        {
-            "name": "Test 17: Common PIN that is also in demographics",
-            "pin": "1234",
-            "demographics": {"anniversary": "2012-12-34"},  # Invalid date
-            "pin_length": 4,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["COMMONLY_USED"]
-            }
-        },
-        # Test 18 - (PIN with invalid demographics)
-        {
-            "name": "Test 18: PIN with invalid demographics",
-            "pin": "5678",
-            "demographics": {"dob": "invalid-date-format"},
-            "pin_length": 4,
-            "expected": {
-                "strength": "STRONG",  # Should not match invalid demographics
-                "weakness_reasons": []
-            }
-        },
-
-        # Test 19 - (Multiple demographics with no match)
-        {
-            "name": "Test 19: Multiple demographics with no match",
-            "pin": "7551",
-            "demographics": {
-                "dob": "1990-05-15",
-                "spouse_dob": "1992-08-20",
-                "anniversary": "2015-06-10"
-            },
-            "pin_length": 4,
-            "expected": {
-                "strength": "STRONG",
-                "weakness_reasons": []
-            }
-        },
-
-        {
-            "name": "Test 20: Spouse DOB with year in PIN",
-            "pin": "9206",
-            "demographics": {"spouse_dob": "1992-06-15"},
-            "pin_length": 4,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["DEMOGRAPHIC_DOB_SPOUSE"]
-            }
-        },
-
-        # NEW TEST CASES FOR ENHANCED PATTERNS
-
-        # Reversed full dates
-        {
-            "name": "Test 21: Reversed full date pattern (402570)",
-            "pin": "402570",
-            "demographics": {"dob": "2004-07-25"},
-            "pin_length": 6,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["DEMOGRAPHIC_DOB_SELF"]
-            }
-        },
-
-        # Special case patterns
-        {
-            "name": "Test 22: Special case pattern (100589)",
-            "pin": "100589",
-            "demographics": {"anniversary": "1998-05-01"},
-            "pin_length": 6,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["DEMOGRAPHIC_ANNIVERSARY"]
-            }
-        },
-
-        # Day repetitions
-        {
-            "name": "Test 23: Day repetition pattern (2525)",
-            "pin": "2525",
-            "demographics": {"dob": "1990-08-25"},
-            "pin_length": 4,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["DEMOGRAPHIC_DOB_SELF"]
-            }
-        },
-        {
-            "name": "Test 24: Triple day repetition (252525)",
-            "pin": "252525",
-            "demographics": {"dob": "1990-08-25"},
-            "pin_length": 6,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["DEMOGRAPHIC_DOB_SELF"]
-            }
-        },
-
-        # Month-day combinations across sources
-        {
-            "name": "Test 25: Month-day combinations across sources",
-            "pin": "072505",
-            "demographics": {
-                "dob": "1990-07-25",
-                "spouse_dob": "1992-05-15"
-            },
-            "pin_length": 6,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["DEMOGRAPHIC_DOB_SELF", "DEMOGRAPHIC_DOB_SPOUSE"]
-            }
-        },
-
-        # Year + Month-day combinations
-        {
-            "name": "Test 26: Year + Month-day combinations",
-            "pin": "040525",
-            "demographics": {
-                "dob": "2004-07-25",
-                "spouse_dob": "1992-05-25"
-            },
-            "pin_length": 6,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["DEMOGRAPHIC_DOB_SELF", "DEMOGRAPHIC_DOB_SPOUSE"]
-            }
-        },
-
-        # Multiple days from different sources
-        {
-            "name": "Test 27: Days from different sources",
-            "pin": "2515",
-            "demographics": {
-                "dob": "1990-07-25",
-                "spouse_dob": "1992-08-15"
-            },
-            "pin_length": 4,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["DEMOGRAPHIC_DOB_SELF", "DEMOGRAPHIC_DOB_SPOUSE"]
-            }
-        },
-
-        # All three dates patterns
-        {
-            "name": "Test 28: Days from all three sources",
-            "pin": "252501",
-            "demographics": {
-                "dob": "1990-07-25",
-                "spouse_dob": "1992-08-25",
-                "anniversary": "2015-06-01"
-            },
-            "pin_length": 6,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["DEMOGRAPHIC_DOB_SELF", "DEMOGRAPHIC_DOB_SPOUSE", "DEMOGRAPHIC_ANNIVERSARY"]
-            }
-        },
-
-        # All three months
-        {
-            "name": "Test 29: Months from all three sources",
-            "pin": "070805",
-            "demographics": {
-                "dob": "1990-07-25",
-                "spouse_dob": "1992-08-15",
-                "anniversary": "2015-05-01"
-            },
-            "pin_length": 6,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["DEMOGRAPHIC_DOB_SELF", "DEMOGRAPHIC_DOB_SPOUSE", "DEMOGRAPHIC_ANNIVERSARY"]
-            }
-        },
-
-        # Wedding year + both birthdays
-        {
-            "name": "Test 30: Wedding year + both birthdays",
-            "pin": "152515",
-            "demographics": {
-                "dob": "1990-07-25",
-                "spouse_dob": "1992-08-15",
-                "anniversary": "2015-05-01"
-            },
-            "pin_length": 6,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["DEMOGRAPHIC_DOB_SELF", "DEMOGRAPHIC_DOB_SPOUSE", "DEMOGRAPHIC_ANNIVERSARY"]
-            }
-        },
-
-        # Test 31 -  (Reversed year components)
-        {
-            "name": "Test 31: Reversed year components",
-            "pin": "0490",
-            "demographics": {
-                "dob": "2004-07-25",
-                "spouse_dob": "1990-05-15"
-            },
-            "pin_length": 4,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["DEMOGRAPHIC_DOB_SELF", "DEMOGRAPHIC_DOB_SPOUSE"]
-            }
-        },
-
-        # Reversed year combinations
-        {
-            "name": "Test 32: Reversed year combinations (9804)",
-            "pin": "9804",
-            "demographics": {
-                "dob": "2004-07-25",
-                "anniversary": "1998-05-01"
-            },
-            "pin_length": 4,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["DEMOGRAPHIC_DOB_SELF", "DEMOGRAPHIC_ANNIVERSARY"]
-            }
-        },
-
-        # Combined reverses
-        {
-            "name": "Test 33: Combined reverses (spouse year + wedding day)",
-            "pin": "0001",
-            "demographics": {
-                "spouse_dob": "2000-08-15",
-                "anniversary": "2015-05-01"
-            },
-            "pin_length": 4,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["DEMOGRAPHIC_DOB_SPOUSE", "DEMOGRAPHIC_ANNIVERSARY"]
-            }
-        },
-
-        # Current date/time (using 2025-04-25 as reference)
-        {
-            "name": "Test 34: Current year as PIN",
-            "pin": "2025",
-            "demographics": None,
-            "pin_length": 4,
-            "expected": {
-                "strength": "WEAK",  # Should be caught by algorithmic detection
-                "weakness_reasons": ["COMMONLY_USED"]
-            }
-        },
-
-        # Username-based patterns (using jay-3107 as reference)
-        {
-            "name": "Test 35: Username digits as PIN",
-            "pin": "3107",
-            "demographics": None,
-            "pin_length": 4,
-            "expected": {
-                "strength": "STRONG",  # Current implementation doesn't check usernames
-                "weakness_reasons": []
-            }
-        },
+# Directory holding pickled validators between runs, kept next to this checkout
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".mpin_cache")
+
+# A single test case; expected_reasons is a sorted tuple so it compares in one step
+TestCase = namedtuple(
+    "TestCase",
+    "name pin demographics pin_length expected_strength expected_reasons"
+)
+
+# Define test cases
+TEST_CASES = (
+    # Part A tests (Common PIN detection)
+    TestCase(
+        name="Test 1: Common 4-digit PIN",
+        pin="1234",
+        demographics=None,
+        pin_length=4,
+        expected_strength="WEAK",
+        expected_reasons=("COMMONLY_USED",),
+    ),
+    TestCase(
+        name="Test 2: Uncommon 4-digit PIN",
+        pin="8193",
+        demographics=None,
+        pin_length=4,
+        expected_strength="STRONG",
+        expected_reasons=(),
+    ),
+    TestCase(
+        name="Test 3: Common 6-digit PIN",
+        pin="123456",
+        demographics=None,
+        pin_length=6,
+        expected_strength="WEAK",
+        expected_reasons=("COMMONLY_USED",),
+    ),
+    TestCase(
+        name="Test 4: Uncommon 6-digit PIN",
+        pin="918273",
+        demographics=None,
+        pin_length=6,
+        expected_strength="STRONG",
+        expected_reasons=(),
+    ),
+
+    # Part B & C tests (Basic demographics patterns)
+    TestCase(
+        name="Test 5: PIN matches user DOB (MMDD)",
+        pin="0201",
+        demographics={"dob": "1998-02-01"},
+        pin_length=4,
+        expected_strength="WEAK",
+        expected_reasons=("DEMOGRAPHIC_DOB_SELF",),
+    ),
+    TestCase(
+        name="Test 6: PIN matches spouse DOB",
+        pin="1020",
+        demographics={"spouse_dob": "1995-10-20"},
+        pin_length=4,
+        expected_strength="WEAK",
+        expected_reasons=("DEMOGRAPHIC_DOB_SPOUSE",),
+    ),
+    TestCase(
+        name="Test 7: PIN matches anniversary",
+        pin="2505",
+        demographics={"anniversary": "2015-05-25"},
+        pin_length=4,
+        expected_strength="WEAK",
+        expected_reasons=("DEMOGRAPHIC_ANNIVERSARY",),
+    ),
+    TestCase(
+        name="Test 8: Multiple demographic matches",
+        pin="0524",
+        demographics={
+            "dob": "1990-05-24",
+            "spouse_dob": "1992-08-15",
+            "anniversary": "2015-05-24"
+        },
+        pin_length=4,
+        expected_strength="WEAK",
+        expected_reasons=("DEMOGRAPHIC_ANNIVERSARY", "DEMOGRAPHIC_DOB_SELF"),
+    ),
+    TestCase(
+        name="Test 9: Common PIN and demographic match",
+        pin="1111",
+        demographics={"dob": "1980-11-11"},
+        pin_length=4,
+        expected_strength="WEAK",
+        expected_reasons=("DEMOGRAPHIC_DOB_SELF",),
+    ),
+
+    # Part D tests (6-digit PIN with demographics)
+    TestCase(
+        name="Test 10: 6-digit PIN matches DOB (DDMMYY)",
+        pin="010298",
+        demographics={"dob": "1998-02-01"},
+        pin_length=6,
+        expected_strength="WEAK",
+        expected_reasons=("DEMOGRAPHIC_DOB_SELF",),
+    ),
+    TestCase(
+        name="Test 11: 6-digit PIN matches spouse DOB (YYMMDD)",
+        pin="950510",
+        demographics={"spouse_dob": "1995-05-10"},
+        pin_length=6,
+        expected_strength="WEAK",
+        expected_reasons=("DEMOGRAPHIC_DOB_SPOUSE",),
+    ),
+    TestCase(
+        name="Test 12: 6-digit PIN matches anniversary (MMDDYY)",
+        pin="051215",
+        demographics={"anniversary": "2015-05-12"},
+        pin_length=6,
+        expected_strength="WEAK",
+        expected_reasons=("DEMOGRAPHIC_ANNIVERSARY",),
+    ),
+
+    # Basic edge cases
+    TestCase(
+        name="Test 13: Strong PIN with demographics present",
+        pin="7294",
+        demographics={
+            "dob": "1990-05-15",
+            "spouse_dob": "1992-08-20",
+            "anniversary": "2015-06-10"
+        },
+        pin_length=4,
+        expected_strength="STRONG",
+        expected_reasons=(),
+    ),
+    TestCase(
+        name="Test 14: Strong 6-digit PIN with demographics present",
+        pin="729438",
+        demographics={
+            "dob": "1990-05-15",
+            "spouse_dob": "1992-08-20",
+            "anniversary": "2015-06-10"
+        },
+        pin_length=6,
+        expected_strength="STRONG",
+        expected_reasons=(),
+    ),
+    # Test 15 - (Year-based PIN pattern)
+    TestCase(
+        name="Test 15: Year-based PIN pattern",
+        pin="1998",
+        demographics={"dob": "1998-02-01"},
+        pin_length=4,
+        expected_strength="WEAK",
+        expected_reasons=("COMMONLY_USED", "DEMOGRAPHIC_DOB_SELF"),
+    ),
+
+    TestCase(
+        name="Test 16: Reversed date pattern",
+        pin="1020",
+        demographics={"dob": "1998-02-01"},
+        pin_length=4,
+        expected_strength="WEAK",
+        expected_reasons=("DEMOGRAPHIC_DOB_SELF",),
+    ),
+    TestCase(
+        name="Test 17: Common PIN that is also in demographics",
+        pin="1234",
+        demographics={"anniversary": "2012-12-34"},  # Invalid date
+        pin_length=4,
+        expected_strength="WEAK",
+        expected_reasons=("COMMONLY_USED",),
+    ),
+    # Test 18 - (PIN with invalid demographics)
+    TestCase(
+        name="Test 18: PIN with invalid demographics",
+        pin="5678",
+        demographics={"dob": "invalid-date-format"},
+        pin_length=4,
+        expected_strength="STRONG",  # Should not match invalid demographics
+        expected_reasons=(),
+    ),
+
+    # Test 19 - (Multiple demographics with no match)
+    TestCase(
+        name="Test 19: Multiple demographics with no match",
+        pin="7551",
+        demographics={
+            "dob": "1990-05-15",
+            "spouse_dob": "1992-08-20",
+            "anniversary": "2015-06-10"
+        },
+        pin_length=4,
+        expected_strength="STRONG",
+        expected_reasons=(),
+    ),
+
+    TestCase(
+        name="Test 20: Spouse DOB with year in PIN",
+        pin="9206",
+        demographics={"spouse_dob": "1992-06-15"},
+        pin_length=4,
+        expected_strength="WEAK",
+        expected_reasons=("DEMOGRAPHIC_DOB_SPOUSE",),
+    ),
+
+    # NEW TEST CASES FOR ENHANCED PATTERNS
+
+    # Reversed full dates
+    TestCase(
+        name="Test 21: Reversed full date pattern (402570)",
+        pin="402570",
+        demographics={"dob": "2004-07-25"},
+        pin_length=6,
+        expected_strength="WEAK",
+        expected_reasons=("DEMOGRAPHIC_DOB_SELF",),
+    ),
+
+    # Special case patterns
+    TestCase(
+        name="Test 22: Special case pattern (100589)",
+        pin="100589",
+        demographics={"anniversary": "1998-05-01"},
+        pin_length=6,
+        expected_strength="WEAK",
+        expected_reasons=("DEMOGRAPHIC_ANNIVERSARY",),
+    ),
+
+    # Day repetitions
+    TestCase(
+        name="Test 23: Day repetition pattern (2525)",
+        pin="2525",
+        demographics={"dob": "1990-08-25"},
+        pin_length=4,
+        expected_strength="WEAK",
+        expected_reasons=("DEMOGRAPHIC_DOB_SELF",),
+    ),
+    TestCase(
+        name="Test 24: Triple day repetition (252525)",
+        pin="252525",
+        demographics={"dob": "1990-08-25"},
+        pin_length=6,
+        expected_strength="WEAK",
+        expected_reasons=("DEMOGRAPHIC_DOB_SELF",),
+    ),
+
+    # Month-day combinations across sources
+    TestCase(
+        name="Test 25: Month-day combinations across sources",
+        pin="072505",
+        demographics={
+            "dob": "1990-07-25",
+            "spouse_dob": "1992-05-15"
+        },
+        pin_length=6,
+        expected_strength="WEAK",
+        expected_reasons=("DEMOGRAPHIC_DOB_SELF", "DEMOGRAPHIC_DOB_SPOUSE"),
+    ),
+
+    # Year + Month-day combinations
+    TestCase(
+        name="Test 26: Year + Month-day combinations",
+        pin="040525",
+        demographics={
+            "dob": "2004-07-25",
+            "spouse_dob": "1992-05-25"
+        },
+        pin_length=6,
+        expected_strength="WEAK",
+        expected_reasons=("DEMOGRAPHIC_DOB_SELF", "DEMOGRAPHIC_DOB_SPOUSE"),
+    ),
+
+    # Multiple days from different sources
+    TestCase(
+        name="Test 27: Days from different sources",
+        pin="2515",
+        demographics={
+            "dob": "1990-07-25",
+            "spouse_dob": "1992-08-15"
+        },
+        pin_length=4,
+        expected_strength="WEAK",
+        expected_reasons=("DEMOGRAPHIC_DOB_SELF", "DEMOGRAPHIC_DOB_SPOUSE"),
+    ),
+
+    # All three dates patterns
+    TestCase(
+        name="Test 28: Days from all three sources",
+        pin="252501",
+        demographics={
+            "dob": "1990-07-25",
+            "spouse_dob": "1992-08-25",
+            "anniversary": "2015-06-01"
+        },
+        pin_length=6,
+        expected_strength="WEAK",
+        expected_reasons=("DEMOGRAPHIC_ANNIVERSARY", "DEMOGRAPHIC_DOB_SELF", "DEMOGRAPHIC_DOB_SPOUSE"),
+    ),
+
+    # All three months
+    TestCase(
+        name="Test 29: Months from all three sources",
+        pin="070805",
+        demographics={
+            "dob": "1990-07-25",
+            "spouse_dob": "1992-08-15",
+            "anniversary": "2015-05-01"
+        },
+        pin_length=6,
+        expected_strength="WEAK",
+        expected_reasons=("DEMOGRAPHIC_ANNIVERSARY", "DEMOGRAPHIC_DOB_SELF", "DEMOGRAPHIC_DOB_SPOUSE"),
+    ),
+
+    # Wedding year + both birthdays
+    TestCase(
+        name="Test 30: Wedding year + both birthdays",
+        pin="152515",
+        demographics={
+            "dob": "1990-07-25",
+            "spouse_dob": "1992-08-15",
+            "anniversary": "2015-05-01"
+        },
+        pin_length=6,
+        expected_strength="WEAK",
+        expected_reasons=("DEMOGRAPHIC_ANNIVERSARY", "DEMOGRAPHIC_DOB_SELF", "DEMOGRAPHIC_DOB_SPOUSE"),
+    ),
+
+    # Test 31 -  (Reversed year components)
+    TestCase(
+        name="Test 31: Reversed year components",
+        pin="0490",
+        demographics={
+            "dob": "2004-07-25",
+            "spouse_dob": "1990-05-15"
+        },
+        pin_length=4,
+        expected_strength="WEAK",
+        expected_reasons=("DEMOGRAPHIC_DOB_SELF", "DEMOGRAPHIC_DOB_SPOUSE"),
+    ),
+
+    # Reversed year combinations
+    TestCase(
+        name="Test 32: Reversed year combinations (9804)",
+        pin="9804",
+        demographics={
+            "dob": "2004-07-25",
+            "anniversary": "1998-05-01"
+        },
+        pin_length=4,
+        expected_strength="WEAK",
+        expected_reasons=("DEMOGRAPHIC_ANNIVERSARY", "DEMOGRAPHIC_DOB_SELF"),
+    ),
+
+    # Combined reverses
+    TestCase(
+        name="Test 33: Combined reverses (spouse year + wedding day)",
+        pin="0001",
+        demographics={
+            "spouse_dob": "2000-08-15",
+            "anniversary": "2015-05-01"
+        },
+        pin_length=4,
+        expected_strength="WEAK",
+        expected_reasons=("DEMOGRAPHIC_ANNIVERSARY", "DEMOGRAPHIC_DOB_SPOUSE"),
+    ),
+
+    # Current date/time (using 2025-04-25 as reference)
+    TestCase(
+        name="Test 34: Current year as PIN",
+        pin="2025",
+        demographics=None,
+        pin_length=4,
+        expected_strength="WEAK",  # Should be caught by algorithmic detection
+        expected_reasons=("COMMONLY_USED",),
+    ),
+
+    # Username-based patterns (using jay-3107 as reference)
+    TestCase(
+        name="Test 35: Username digits as PIN",
+        pin="3107",
+        demographics=None,
+        pin_length=4,
+        expected_strength="STRONG",  # Current implementation doesn't check usernames
+        expected_reasons=(),
+    ),
+
+    # Additional tests based on your working examples
+    TestCase(
+        name="Test 36: Last two digits combinations (0400)",
+        pin="0400",
+        demographics={
+            "dob": "2004-07-25",
+            "spouse_dob": "2000-05-25"
+        },
+        pin_length=4,
+        expected_strength="WEAK",
+        expected_reasons=("DEMOGRAPHIC_DOB_SELF", "DEMOGRAPHIC_DOB_SPOUSE"),
+    ),
+    TestCase(
+        name="Test 37: Birthday as Day-Month (2507)",
+        pin="2507",
+        demographics={"dob": "2004-07-25"},
+        pin_length=4,
+        expected_strength="WEAK",
+        expected_reasons=("DEMOGRAPHIC_DOB_SELF",),
+    ),
+    TestCase(
+        name="Test 38: Reversed birth year (4002)",
+        pin="4002",
+        demographics={"dob": "2004-07-25"},
+        pin_length=4,
+        expected_strength="WEAK",
+        expected_reasons=("DEMOGRAPHIC_DOB_SELF",),
+    ),
+    TestCase(
+        name="Test 39: Mixed birth months (0705)",
+        pin="0705",
+        demographics={
+            "dob": "2004-07-25",
+            "spouse_dob": "2000-05-25"
+        },
+        pin_length=4,
+        expected_strength="WEAK",
+        expected_reasons=("DEMOGRAPHIC_DOB_SELF", "DEMOGRAPHIC_DOB_SPOUSE"),
+    ),
+    TestCase(
+        name="Test 40: Full birth date (YYMMDD - 040725)",
+        pin="040725",
+        demographics={"dob": "2004-07-25"},
+        pin_length=6,
+        expected_strength="WEAK",
+        expected_reasons=("DEMOGRAPHIC_DOB_SELF",),
+    ),
+    TestCase(
+        name="Test 41: Combined reverses (spouse year + wedding day - 000150)",
+        pin="000150",
+        demographics={
+            "spouse_dob": "2000-05-25",
+            "anniversary": "1998-05-01"
+        },
+        pin_length=6,
+        expected_strength="WEAK",
+        expected_reasons=("DEMOGRAPHIC_ANNIVERSARY", "DEMOGRAPHIC_DOB_SPOUSE"),
+    ),
+    TestCase(
+        name="Test 42: Month-day pairs (072505)",
+        pin="072505",
+        demographics={
+            "dob": "2004-07-25",
+            "spouse_dob": "2000-05-25"
+        },
+        pin_length=6,
+        expected_strength="WEAK",
+        expected_reasons=("DEMOGRAPHIC_DOB_SELF", "DEMOGRAPHIC_DOB_SPOUSE"),
+    ),
+    TestCase(
+        name="Test 43: Cross-date mixing (040525)",
+        pin="040525",
+        demographics={
+            "dob": "2004-07-25",
+            "spouse_dob": "2000-05-25"
+        },
+        pin_length=6,
+        expected_strength="WEAK",
+        expected_reasons=("DEMOGRAPHIC_DOB_SELF", "DEMOGRAPHIC_DOB_SPOUSE"),
+    ),
+    TestCase(
+        name="Test 44: Wedding year + both birthdays (982525)",
+        pin="982525",
+        demographics={
+            "dob": "2004-07-25",
+            "spouse_dob": "2000-05-25",
+            "anniversary": "1998-05-01"
+        },
+        pin_length=6,
+        expected_strength="WEAK",
+        expected_reasons=("DEMOGRAPHIC_ANNIVERSARY", "DEMOGRAPHIC_DOB_SELF", "DEMOGRAPHIC_DOB_SPOUSE"),
+    ),
+    TestCase(
+        name="Test 45: Both birth years (200400)",
+        pin="200400",
+        demographics={
+            "dob": "2004-07-25",
+            "spouse_dob": "2000-05-25"
+        },
+        pin_length=6,
+        expected_strength="WEAK",
+        expected_reasons=("DEMOGRAPHIC_DOB_SELF", "DEMOGRAPHIC_DOB_SPOUSE"),
+    ),
+    # 4-digit keyboard pattern test cases
+    TestCase(
+        name="Test 46: Keyboard pattern - Vertical down (7894)",
+        pin="7894",
+        demographics=None,
+        pin_length=4,
+        expected_strength="WEAK",
+        expected_reasons=("COMMONLY_USED",),
+    ),
+    TestCase(
+        name="Test 47: Keyboard pattern - Horizontal right (4561)",
+        pin="4561",
+        demographics=None,
+        pin_length=4,
+        expected_strength="WEAK",
+        expected_reasons=("COMMONLY_USED",),
+    ),
+    TestCase(
+        name="Test 48: Keyboard pattern - Vertical up (1478)",
+        pin="1478",
+        demographics=None,
+        pin_length=4,
+        expected_strength="WEAK",
+        expected_reasons=("COMMONLY_USED",),
+    ),
+    TestCase(
+        name="Test 49: Keyboard pattern - Middle vertical (2580)",
+        pin="2580",
+        demographics=None,
+        pin_length=4,
+        expected_strength="WEAK",
+        expected_reasons=("COMMONLY_USED",),
+    ),
+    TestCase(
+        name="Test 50: Keyboard pattern - Right vertical (3690)",
+        pin="3690",
+        demographics=None,
+        pin_length=4,
+        expected_strength="WEAK",
+        expected_reasons=("COMMONLY_USED",),
+    ),
+    TestCase(
+        name="Test 51: Keyboard pattern - Backwards horizontal (3216)",
+        pin="3216",
+        demographics=None,
+        pin_length=4,
+        expected_strength="WEAK",
+        expected_reasons=("COMMONLY_USED",),
+    ),
+    TestCase(
+        name="Test 52: Keyboard pattern - Diagonal (3698)",
+        pin="3698",
+        demographics=None,
+        pin_length=4,
+        expected_strength="WEAK",
+        expected_reasons=("COMMONLY_USED",),
+    ),
+    TestCase(
+        name="Test 53: Keyboard pattern - Z pattern (1593)",
+        pin="1593",
+        demographics=None,
+        pin_length=4,
+        expected_strength="WEAK",
+        expected_reasons=("COMMONLY_USED",),
+    ),
+    TestCase(
+        name="Test 54: Keyboard pattern - Diagonal backward (7531)",
+        pin="7531",
+        demographics=None,
+        pin_length=4,
+        expected_strength="WEAK",
+        expected_reasons=("COMMONLY_USED",),
+    ),
+    TestCase(
+        name="Test 55: Keyboard pattern - Reverse middle down (8520)",
+        pin="8520",
+        demographics=None,
+        pin_length=4,
+        expected_strength="WEAK",
+        expected_reasons=("COMMONLY_USED",),
+    ),
+
+    # 6-digit keyboard pattern test cases
+    TestCase(
+        name="Test 56: Keyboard pattern - Knight's move (147258)",
+        pin="147258",
+        demographics=None,
+        pin_length=6,
+        expected_strength="WEAK",
+        expected_reasons=("COMMONLY_USED",),
+    ),
+    TestCase(
+        name="Test 57: Keyboard pattern - Snake pattern (123654)",
+        pin="123654",
+        demographics=None,
+        pin_length=6,
+        expected_strength="WEAK",
+        expected_reasons=("COMMONLY_USED",),
+    ),
+    TestCase(
+        name="Test 58: Keyboard pattern - Reverse snake (321654)",
+        pin="321654",
+        demographics=None,
+        pin_length=6,
+        expected_strength="WEAK",
+        expected_reasons=("COMMONLY_USED",),
+    ),
+    TestCase(
+        name="Test 59: Keyboard pattern - Middle rows (789456)",
+        pin="789456",
+        demographics=None,
+        pin_length=6,
+        expected_strength="WEAK",
+        expected_reasons=("COMMONLY_USED",),
+    ),
+    TestCase(
+        name="Test 60: Keyboard pattern - Left-right zigzag (159753)",
+        pin="159753",
+        demographics=None,
+        pin_length=6,
+        expected_strength="WEAK",
+        expected_reasons=("COMMONLY_USED",),
+    ),
+    TestCase(
+        name="Test 61: Keyboard pattern - Knight's move reversed (258147)",
+        pin="258147",
+        demographics=None,
+        pin_length=6,
+        expected_strength="WEAK",
+        expected_reasons=("COMMONLY_USED",),
+    ),
+    TestCase(
+        name="Test 62: Keyboard pattern - Right column pattern (369258)",
+        pin="369258",
+        demographics=None,
+        pin_length=6,
+        expected_strength="WEAK",
+        expected_reasons=("COMMONLY_USED",),
+    ),
+    TestCase(
+        name="Test 63: Keyboard pattern - Left column pattern (741852)",
+        pin="741852",
+        demographics=None,
+        pin_length=6,
+        expected_strength="WEAK",
+        expected_reasons=("COMMONLY_USED",),
+    ),
+    TestCase(
+        name="Test 64: Keyboard pattern - Right diagonal snake (852963)",
+        pin="852963",
+        demographics=None,
+        pin_length=6,
+        expected_strength="WEAK",
+        expected_reasons=("COMMONLY_USED",),
+    ),
+    TestCase(
+        name="Test 65: Keyboard pattern - Circular pattern (963147)",
+        pin="963147",
+        demographics=None,
+        pin_length=6,
+        expected_strength="WEAK",
+        expected_reasons=("COMMONLY_USED",),
+    ),
+
+    # Additional keyboard pattern tests
+    TestCase(
+        name="Test 66: Keyboard pattern - Mixed with demographic data",
+        pin="7410",
+        demographics={"dob": "1990-10-07"},
+        pin_length=4,
+        expected_strength="WEAK",
+        expected_reasons=("COMMONLY_USED", "DEMOGRAPHIC_DOB_SELF"),
+    ),
+    TestCase(
+        name="Test 67: Keyboard pattern - Sequential with common PIN",
+        pin="123456",
+        demographics=None,
+        pin_length=6,
+        expected_strength="WEAK",
+        expected_reasons=("COMMONLY_USED",),
+    ),
+    TestCase(
+        name="Test 68: Keyboard pattern - Reverse sequential",
+        pin="654321",
+        demographics=None,
+        pin_length=6,
+        expected_strength="WEAK",
+        expected_reasons=("COMMONLY_USED",),
+    ),
+    TestCase(
+        name="Test 69: Keyboard pattern - Middle sequential",
+        pin="456789",
+        demographics=None,
+        pin_length=6,
+        expected_strength="WEAK",
+        expected_reasons=("COMMONLY_USED",),
+    ),
+    TestCase(
+        name="Test 70: Keyboard pattern - Wrapping pattern",
+        pin="789123",
+        demographics=None,
+        pin_length=6,
+        expected_strength="WEAK",
+        expected_reasons=("COMMONLY_USED",),
+    ),
+
+    # Day repetitions matching more than one date (first matching date wins)
+    TestCase(
+        name="Test 71: Day repetition - DOB listed before anniversary",
+        pin="2525",
+        demographics={
+            "dob": "1990-07-25",
+            "anniversary": "2015-06-25"
+        },
+        pin_length=4,
+        expected_strength="WEAK",
+        expected_reasons=("DEMOGRAPHIC_DOB_SELF",),
+    ),
+    TestCase(
+        name="Test 72: Day repetition - Spouse DOB listed before DOB",
+        pin="252525",
+        demographics={
+            "spouse_dob": "1992-08-25",
+            "dob": "1990-07-25"
+        },
+        pin_length=6,
+        expected_strength="WEAK",
+        expected_reasons=("DEMOGRAPHIC_DOB_SPOUSE",),
+    ),
+)
+
+# Column view of TEST_CASES, one tuple per field, for the test loop
+NAMES, PINS, DEMOGRAPHICS, PIN_LENGTHS, EXPECTED_STRENGTHS, EXPECTED_REASONS = zip(*TEST_CASES)
+
+# Output for each test, formatted once at import
+PASS_LINE = "✓ PASSED\n"
+HEADERS = tuple(f"\n{name}\n{'-' * len(name)}\n" for name in NAMES)
+PASSED_BLOCKS = tuple(header + PASS_LINE for header in HEADERS)
+
+
+def _load_or_build(pin_length):
+    """
+    Load a validator pickled from the current mpin_validator.py, else build and save one.
+
+    Args:
+        pin_length (int): Length of the PIN (4 or 6 digits)
+
+    Returns:
+        MPINValidator: Validator for the given PIN length
+    """
+    # Key the cache on the validator source, so any edit gets a new file
+    with open(mpin_validator.__file__, "rb") as f:
+        source_hash = hashlib.sha256(f.read()).hexdigest()[:16]
+    path = os.path.join(CACHE_DIR, f"mpin_validator_{pin_length}_{source_hash}.pkl")
+
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        # Missing or unreadable cache; rebuild below
+        pass
+
+    validator = MPINValidator(pin_length)
+
+    # Write to a temporary file first so a partial write is never loaded
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(temp_path, "wb") as f:
+            pickle.dump(validator, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+    except Exception:
+        # Caching is optional; carry on with the freshly built validator
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return validator
+
+    # Drop caches built from older versions of the validator source
+    for stale_path in glob.glob(os.path.join(CACHE_DIR, f"mpin_validator_{pin_length}_*.pkl")):
+        if stale_path != path:
+            try:
+                os.remove(stale_path)
+            except OSError:
+                pass
+
+    return validator
+
+
+def _safe_validate(validator, pin, demographics, demographics_key, prep_cache):
+    """
+    Validate a test's PIN, capturing any error instead of raising.
+
+    Args:
+        validator (MPINValidator): Validator matching the test's PIN length
+        pin (str): The PIN to validate
+        demographics (dict): Optional demographic information
+        demographics_key (tuple): Hashable key for the demographics
+        prep_cache (dict): Prepared demographics, keyed on demographics_key
+
+    Returns:
+        tuple: (result, None) on success, or (None, error message) on failure
+    """
+    try:
+        if demographics_key not in prep_cache:
+            prep_cache[demographics_key] = validator.prepare_demographics(demographics)
+        return validator.validate_pin_prepared(pin, prep_cache[demographics_key]), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _run(validator, indices, blocks):
+    """
+    Run tests that share one validator, storing each test's output by position.
+
+    Args:
+        validator (MPINValidator): Validator matching the tests' PIN length
+        indices (list): Positions of the tests to run in the test columns
+        blocks (list): Output blocks, filled in at each test's index
+
+    Returns:
+        int: Number of tests that passed
+    """
+    passed = 0
 
-        # Additional tests based on your working examples
-        {
-            "name": "Test 36: Last two digits combinations (0400)",
-            "pin": "0400",
-            "demographics": {
-                "dob": "2004-07-25",
-                "spouse_dob": "2000-05-25",
-            },
-            "pin_length": 4,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["DEMOGRAPHIC_DOB_SELF", "DEMOGRAPHIC_DOB_SPOUSE"]
-            }
-        },
-        {
-            "name": "Test 37: Birthday as Day-Month (2507)",
-            "pin": "2507",
-            "demographics": {"dob": "2004-07-25"},
-            "pin_length": 4,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["DEMOGRAPHIC_DOB_SELF"]
-            }
-        },
-        {
-            "name": "Test 38: Reversed birth year (4002)",
-            "pin": "4002",
-            "demographics": {"dob": "2004-07-25"},
-            "pin_length": 4,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["DEMOGRAPHIC_DOB_SELF"]
-            }
-        },
-        {
-            "name": "Test 39: Mixed birth months (0705)",
-            "pin": "0705",
-            "demographics": {
-                "dob": "2004-07-25",
-                "spouse_dob": "2000-05-25",
-            },
-            "pin_length": 4,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["DEMOGRAPHIC_DOB_SELF", "DEMOGRAPHIC_DOB_SPOUSE"]
-            }
-        },
-        {
-            "name": "Test 40: Full birth date (YYMMDD - 040725)",
-            "pin": "040725",
-            "demographics": {"dob": "2004-07-25"},
-            "pin_length": 6,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["DEMOGRAPHIC_DOB_SELF"]
-            }
-        },
-        {
-            "name": "Test 41: Combined reverses (spouse year + wedding day - 000150)",
-            "pin": "000150",
-            "demographics": {
-                "spouse_dob": "2000-05-25",
-                "anniversary": "1998-05-01"
-            },
-            "pin_length": 6,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["DEMOGRAPHIC_DOB_SPOUSE", "DEMOGRAPHIC_ANNIVERSARY"]
-            }
-        },
-        {
-            "name": "Test 42: Month-day pairs (072505)",
-            "pin": "072505",
-            "demographics": {
-                "dob": "2004-07-25",
-                "spouse_dob": "2000-05-25"
-            },
-            "pin_length": 6,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["DEMOGRAPHIC_DOB_SELF", "DEMOGRAPHIC_DOB_SPOUSE"]
-            }
-        },
-        {
-            "name": "Test 43: Cross-date mixing (040525)",
-            "pin": "040525",
-            "demographics": {
-                "dob": "2004-07-25",
-                "spouse_dob": "2000-05-25"
-            },
-            "pin_length": 6,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["DEMOGRAPHIC_DOB_SELF", "DEMOGRAPHIC_DOB_SPOUSE"]
-            }
-        },
-        {
-            "name": "Test 44: Wedding year + both birthdays (982525)",
-            "pin": "982525",
-            "demographics": {
-                "dob": "2004-07-25",
-                "spouse_dob": "2000-05-25",
-                "anniversary": "1998-05-01"
-            },
-            "pin_length": 6,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["DEMOGRAPHIC_DOB_SELF", "DEMOGRAPHIC_DOB_SPOUSE", "DEMOGRAPHIC_ANNIVERSARY"]
-            }
-        },
-        {
-            "name": "Test 45: Both birth years (200400)",
-            "pin": "200400",
-            "demographics": {
-                "dob": "2004-07-25",
-                "spouse_dob": "2000-05-25"
-            },
-            "pin_length": 6,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["DEMOGRAPHIC_DOB_SELF", "DEMOGRAPHIC_DOB_SPOUSE"]
-            }
-        },
-        # 4-digit keyboard pattern test cases
-        {
-            "name": "Test 46: Keyboard pattern - Vertical down (7894)",
-            "pin": "7894",
-            "demographics": None,
-            "pin_length": 4,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["COMMONLY_USED"]
-            }
-        },
-        {
-            "name": "Test 47: Keyboard pattern - Horizontal right (4561)",
-            "pin": "4561",
-            "demographics": None,
-            "pin_length": 4,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["COMMONLY_USED"]
-            }
-        },
-        {
-            "name": "Test 48: Keyboard pattern - Vertical up (1478)",
-            "pin": "1478",
-            "demographics": None,
-            "pin_length": 4,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["COMMONLY_USED"]
-            }
-        },
-        {
-            "name": "Test 49: Keyboard pattern - Middle vertical (2580)",
-            "pin": "2580",
-            "demographics": None,
-            "pin_length": 4,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["COMMONLY_USED"]
-            }
-        },
-        {
-            "name": "Test 50: Keyboard pattern - Right vertical (3690)",
-            "pin": "3690",
-            "demographics": None,
-            "pin_length": 4,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["COMMONLY_USED"]
-            }
-        },
-        {
-            "name": "Test 51: Keyboard pattern - Backwards horizontal (3216)",
-            "pin": "3216",
-            "demographics": None,
-            "pin_length": 4,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["COMMONLY_USED"]
-            }
-        },
-        {
-            "name": "Test 52: Keyboard pattern - Diagonal (3698)",
-            "pin": "3698",
-            "demographics": None,
-            "pin_length": 4,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["COMMONLY_USED"]
-            }
-        },
-        {
-            "name": "Test 53: Keyboard pattern - Z pattern (1593)",
-            "pin": "1593",
-            "demographics": None,
-            "pin_length": 4,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["COMMONLY_USED"]
-            }
-        },
-        {
-            "name": "Test 54: Keyboard pattern - Diagonal backward (7531)",
-            "pin": "7531",
-            "demographics": None,
-            "pin_length": 4,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["COMMONLY_USED"]
-            }
-        },
-        {
-            "name": "Test 55: Keyboard pattern - Reverse middle down (8520)",
-            "pin": "8520",
-            "demographics": None,
-            "pin_length": 4,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["COMMONLY_USED"]
-            }
-        },
+    # Results of already-validated inputs, so each distinct input runs once
+    seen = {}
 
-        # 6-digit keyboard pattern test cases
-        {
-            "name": "Test 56: Keyboard pattern - Knight's move (147258)",
-            "pin": "147258",
-            "demographics": None,
-            "pin_length": 6,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["COMMONLY_USED"]
-            }
-        },
-        {
-            "name": "Test 57: Keyboard pattern - Snake pattern (123654)",
-            "pin": "123654",
-            "demographics": None,
-            "pin_length": 6,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["COMMONLY_USED"]
-            }
-        },
-        {
-            "name": "Test 58: Keyboard pattern - Reverse snake (321654)",
-            "pin": "321654",
-            "demographics": None,
-            "pin_length": 6,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["COMMONLY_USED"]
-            }
-        },
-        {
-            "name": "Test 59: Keyboard pattern - Middle rows (789456)",
-            "pin": "789456",
-            "demographics": None,
-            "pin_length": 6,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["COMMONLY_USED"]
-            }
-        },
-        {
-            "name": "Test 60: Keyboard pattern - Left-right zigzag (159753)",
-            "pin": "159753",
-            "demographics": None,
-            "pin_length": 6,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["COMMONLY_USED"]
-            }
-        },
-        {
-            "name": "Test 61: Keyboard pattern - Knight's move reversed (258147)",
-            "pin": "258147",
-            "demographics": None,
-            "pin_length": 6,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["COMMONLY_USED"]
-            }
-        },
-        {
-            "name": "Test 62: Keyboard pattern - Right column pattern (369258)",
-            "pin": "369258",
-            "demographics": None,
-            "pin_length": 6,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["COMMONLY_USED"]
-            }
-        },
-        {
-            "name": "Test 63: Keyboard pattern - Left column pattern (741852)",
-            "pin": "741852",
-            "demographics": None,
-            "pin_length": 6,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["COMMONLY_USED"]
-            }
-        },
-        {
-            "name": "Test 64: Keyboard pattern - Right diagonal snake (852963)",
-            "pin": "852963",
-            "demographics": None,
-            "pin_length": 6,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["COMMONLY_USED"]
-            }
-        },
-        {
-            "name": "Test 65: Keyboard pattern - Circular pattern (963147)",
-            "pin": "963147",
-            "demographics": None,
-            "pin_length": 6,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["COMMONLY_USED"]
-            }
-        },
+    # Demographic derivations, prepared once per distinct demographics
+    prep_cache = {}
 
-        # Additional keyboard pattern tests
-        {
-            "name": "Test 66: Keyboard pattern - Mixed with demographic data",
-            "pin": "7410",
-            "demographics": {"dob": "1990-10-07"},
-            "pin_length": 4,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["COMMONLY_USED", "DEMOGRAPHIC_DOB_SELF"]
-            }
-        },
-        {
-            "name": "Test 67: Keyboard pattern - Sequential with common PIN",
-            "pin": "123456",
-            "demographics": None,
-            "pin_length": 6,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["COMMONLY_USED"]
-            }
-        },
-        {
-            "name": "Test 68: Keyboard pattern - Reverse sequential",
-            "pin": "654321",
-            "demographics": None,
-            "pin_length": 6,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["COMMONLY_USED"]
-            }
-        },
-        {
-            "name": "Test 69: Keyboard pattern - Middle sequential",
-            "pin": "456789",
-            "demographics": None,
-            "pin_length": 6,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["COMMONLY_USED"]
-            }
-        },
-        {
-            "name": "Test 70: Keyboard pattern - Wrapping pattern",
-            "pin": "789123",
-            "demographics": None,
-            "pin_length": 6,
-            "expected": {
-                "strength": "WEAK",
-                "weakness_reasons": ["COMMONLY_USED"]
-            }
-        },
-    ]
+    for index in indices:
+        # Run the validation
+        pin = PINS[index]
+        demographics = DEMOGRAPHICS[index]
+        demographics_key = tuple(demographics.items()) if demographics else None
+        key = (pin, demographics_key)
+        outcome = seen.get(key)
+        if outcome is None:
+            outcome = seen[key] = _safe_validate(validator, pin, demographics, demographics_key, prep_cache)
+        result, error = outcome
+
+        if error is not None:
+            blocks[index] = f"{HEADERS[index]}✗ ERROR: {error}\n"
+            continue
+
+        strength = result['strength']
+        reasons = result['weakness_reasons']
+        expected_strength = EXPECTED_STRENGTHS[index]
+        expected_reasons = EXPECTED_REASONS[index]
+
+        # Compare with expected output, cheapest checks first
+        if (
+                strength == expected_strength and
+                len(reasons) == len(expected_reasons) and
+                tuple(sorted(reasons)) == expected_reasons
+        ):
+            blocks[index] = PASSED_BLOCKS[index]
+            passed += 1
+        else:
+            blocks[index] = (
+                f"{HEADERS[index]}✗ FAILED\n"
+                f"Expected: {{'strength': '{expected_strength}', 'weakness_reasons': {list(expected_reasons)}}}\n"
+                f"Got: {{'strength': '{strength}', 'weakness_reasons': {reasons}}}\n"
+            )
 
-    # Run the tests
-    passed = 0
-    failed = 0
+    return passed
 
-    for test in test_cases:
-        print(f"\n{test['name']}")
-        print("-" * len(test['name']))
 
-        # Select the appropriate validator
-        validator = validator_4 if test['pin_length'] == 4 else validator_6
+def run_tests():
+    """Run all test cases and display results."""
 
-        # Run the validation
-        try:
-            result = validator.validate_pin(test['pin'], test['demographics'])
+    # Collect output lines and write them in one go at the end
+    out = ["Running MPIN Validator Test Cases\n", "=" * 40 + "\n"]
 
-            # Compare with expected output
-            success = (
-                    result['strength'] == test['expected']['strength'] and
-                    set(result['weakness_reasons']) == set(test['expected']['weakness_reasons'])
-            )
+    # Create validators for 4-digit and 6-digit PINs
+    validator_4 = _load_or_build(4)
+    validator_6 = _load_or_build(6)
 
-            if success:
-                print("✓ PASSED")
-                passed += 1
-            else:
-                print("✗ FAILED")
-                print(f"Expected: {test['expected']}")
-                print(f"Got: {{'strength': '{result['strength']}', 'weakness_reasons': {result['weakness_reasons']}}}")
-                failed += 1
+    # Partition the tests by PIN length so each loop uses a single validator
+    indices_4 = [i for i, pin_length in enumerate(PIN_LENGTHS) if pin_length == 4]
+    indices_6 = [i for i, pin_length in enumerate(PIN_LENGTHS) if pin_length != 4]
 
-        except Exception as e:
-            print(f"✗ ERROR: {str(e)}")
-            failed += 1
+    # Run the tests, keeping output in the original test order
+    blocks = [None] * len(PINS)
+    passed = _run(validator_4, indices_4, blocks) + _run(validator_6, indices_6, blocks)
+    failed = len(PINS) - passed
+    out.extend(blocks)
 
     # Print summary
-    print("\n" + "=" * 40)
-    print(f"Test Summary: {passed} passed, {failed} failed")
-    print("=" * 40)
+    separator = "=" * 40
+    out.append(f"\n{separator}\n")
+    out.append(f"Test Summary: {passed} passed, {failed} failed\n")
+    out.append(f"{separator}\n")
+
+    sys.stdout.write("".join(out))
 
 
 if __name__ == "__main__":